@@ -4,16 +4,203 @@ Classes and functions for displaying anything on anything (in theory).
 
 # ======================================================================
 
-from   abc    import ABC, abstractmethod
-from   PIL    import Image
-from   typing import Tuple
+from   abc       import ABC, abstractmethod
+from   functools import lru_cache
+from   PIL       import Image
+from   typing    import Callable, Tuple
 
+import importlib
 import logging
 import math
 import numpy
 
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional so, if we don't have it, we just fall back to running
+    # things as plain Python
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda function: function
+
+# The submodules which hold the different displays. These are only imported
+# when they are first used, via `__getattr__` below.
+_DISPLAY_MODULES = ('lumaled', 'pils', 'pimoroni', 'rgbledmatrix', 'sdl', 'terminal')
+
+def __getattr__(name : str):
+    """
+    Import the display submodules on demand, so that ``anydisplay.sdl`` etc.
+    work without importing them all up front.
+    """
+    if name in _DISPLAY_MODULES:
+        return importlib.import_module('.' + name, __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Hidden debugging toggle for the `Canvas` code. This is a module-level value,
+# rather than a member, since it gets checked in the hot paths.
+_DEBUG = False
+
 # ======================================================================
 
+@lru_cache(maxsize=32)
+def _offsets(scale : float) -> Tuple[float,float]:
+    """
+    Determine how far a square pixel of the given size extends to the left
+    and right (and, equivalently, above and below) of its position.
+
+    This only depends on the scale, which is typically the same for many calls
+    in a row, so we cache it.
+
+    :return: The left and right offsets.
+    """
+    half = max(0.0, (scale - 1.0) / 2.0)
+    if int(scale) & 1:
+        # Odd scale grows right with the fraction
+        l_off = int(half)
+        r_off = scale - l_off
+    else:
+        # Even grows left
+        r_off = int(half)
+        l_off = scale - r_off
+    return (l_off, r_off)
+
+
+@njit(cache=True, nogil=True, fastmath=True)
+def _blend_pixel(r      : numpy.ndarray,
+                 g      : numpy.ndarray,
+                 b      : numpy.ndarray,
+                 f      : numpy.ndarray,
+                 px     : int,
+                 py     : int,
+                 dr     : float,
+                 dg     : float,
+                 db     : float,
+                 factor : float) -> None:
+    """
+    Blend the given colour into the canvas pixel at ``px,py``, where the colour
+    covers ``factor`` of the pixel's area. The canvas is given as its red, green,
+    blue and painted-fraction planes.
+    """
+    pr = r[px, py]
+    pg = g[px, py]
+    pb = b[px, py]
+    pf = f[px, py]
+
+    # Account for the fact that the area might not have been fully painted
+    # previously
+    factor1 = 1.0 - factor
+    if pf == 0.0 or pf <= factor1:
+        # This is a straight addition since we're not "taking away" from the
+        # existing space. E.g. if we'd only painted 0.1 of the canvas before
+        # and now we're painting 0.7 then there's still 0.2 of unaccounted for
+        # space.
+        pr = pr + factor * dr
+        pg = pg + factor * dg
+        pb = pb + factor * db
+        pf = factor + pf
+    else:
+        # Okay, here we're taking away from what was there before. We account
+        # for this by scaling the existing colour into the same space before
+        # we take the weighted average. We fold this into the factor1 value to
+        # save multiple divides. Here pf can't be zero since we checked above.
+        pfactor1 = factor1 / pf
+        pr = min(pfactor1 * pr + factor * dr, 1.0)
+        pg = min(pfactor1 * pg + factor * dg, 1.0)
+        pb = min(pfactor1 * pb + factor * db, 1.0)
+        pf = 1.0 # <-- fully painted now
+
+    # Remember
+    r[px, py] = pr if pr < 1.0 else 1.0
+    g[px, py] = pg if pg < 1.0 else 1.0
+    b[px, py] = pb if pb < 1.0 else 1.0
+    f[px, py] = pf if pf < 1.0 else 1.0
+
+
+@njit(cache=True, nogil=True, fastmath=True)
+def _blend_square(r     : numpy.ndarray,
+                  g     : numpy.ndarray,
+                  b     : numpy.ndarray,
+                  f     : numpy.ndarray,
+                  dirty : numpy.ndarray,
+                  dxl   : float,
+                  dxr   : float,
+                  dyt   : float,
+                  dyb   : float,
+                  dr    : float,
+                  dg    : float,
+                  db    : float,
+                  xwrap : bool,
+                  ywrap : bool) -> None:
+    """
+    Blend the given colour into the canvas over the square with the given
+    left, right, top and bottom edges, in display coordinates. The display
+    pixels on the edges of the square are blended according to how much of
+    them it covers. The canvas is given as its red, green, blue and
+    painted-fraction planes, along with the dirty mask which we update.
+    """
+    (width, height) = r.shape
+
+    # The canvas planes are indexed as [x,y] so y is the fastest varying axis
+    # in memory. As such we walk the columns in the outer loop, working out
+    # everything we need for the x value there, and then walk down the column
+    # in the inner loop.
+    for px_ in range(int(dxl), int(dxr) + 1):
+        # Copy, since we noodle this
+        px = px_
+
+        # See how we are clipping the value, to determine the pixel
+        # width. Here the far corner of the pixel is the near corner of
+        # the adjacent pixel, when it comes to computing the area.
+        cxl    = max(dxl, px+0)
+        cxr    = min(dxr, px+1)
+        xwidth = abs(cxr - cxl)
+        if xwidth <= 0.0:
+            continue
+
+        # Now noodle the pixel x if we are wrapping. Else we bail if
+        # it's out of bounds. Nothing here is bounds checked when compiled so
+        # we have to make sure that it's on the canvas, however far off it
+        # was.
+        if px < 0 or px >= width:
+            if xwrap:
+                px %= width
+            else:
+                continue
+
+        for py_ in range(int(dyt), int(dyb) + 1):
+            # Copy, since we noodle this
+            py = py_
+
+            # Since the area of a pixel is 1x1=1 the area here is also
+            # the fraction.
+            cyt  = max(dyt, py+0)
+            cyb  = min(dyb, py+1)
+            area = xwidth * abs(cyb - cyt)
+
+            # The blending factor is the area of the display pixel
+            # covered. 0 means none and 1.0 means all. If this factor
+            # is non-postive then we have nothing to do.
+            factor = area
+            if factor <= 0.0:
+                continue
+            if factor > 1.0:
+                factor = 1.0
+
+            # Now noodle the pixel y if we are wrapping. Else we bail
+            # if it's out of bounds.
+            if py < 0 or py >= height:
+                if ywrap:
+                    py %= height
+                else:
+                    continue
+
+            # Finally we can now set it. We do this by blending with
+            # what was there before.
+            _blend_pixel(r, g, b, f, px, py, dr, dg, db, factor)
+            dirty[px, py] = True
+
+
 class Display(ABC):
     """
     The interface which all displays must implement. This is the interface to
@@ -25,6 +212,7 @@ class Display(ABC):
     """
     def __init__(self):
         self._orientation = 0
+        self._orient      = self._orienter(0)
 
 
     @property
@@ -88,6 +276,26 @@ class Display(ABC):
         pass
 
 
+    def set_u8(self,
+               x: int,
+               y: int,
+               r: int,
+               g: int,
+               b: int) -> None:
+        """
+        The same as `set` but with the colour given as byte values. Displays
+        which hold their pixels as bytes may override this to store the values
+        as-is, without scaling and clamping them.
+
+        :param x: The x coordinate.
+        :param y: The y coordinate.
+        :param r: The red value, ``[0,255]``.
+        :param g: The green value, ``[0,255]``.
+        :param b: The blue value, ``[0,255]``.
+        """
+        self.set(x, y, r / 255.0, g / 255.0, b / 255.0)
+
+
     @abstractmethod
     def show(self) -> None:
         """
@@ -96,6 +304,31 @@ class Display(ABC):
         pass
 
 
+    def set_many(self,
+                 xs: numpy.ndarray,
+                 ys: numpy.ndarray,
+                 rs: numpy.ndarray,
+                 gs: numpy.ndarray,
+                 bs: numpy.ndarray) -> None:
+        """
+        Set the values of many pixels at once. This is the same as calling
+        `set` for each of the pixels in turn, which is what the default
+        implementation does. Displays may override this with something faster.
+
+        :param xs: The x coordinates.
+        :param ys: The y coordinates.
+        :param rs: The red values, ``[0,1]``.
+        :param gs: The green values, ``[0,1]``.
+        :param bs: The blue values, ``[0,1]``.
+        """
+        for (x, y, r, g, b) in zip(numpy.asarray(xs).tolist(),
+                                   numpy.asarray(ys).tolist(),
+                                   numpy.asarray(rs).tolist(),
+                                   numpy.asarray(gs).tolist(),
+                                   numpy.asarray(bs).tolist()):
+            self.set(x, y, r, g, b)
+
+
     def set_orientation(self, orientation: int) -> None:
         """
         Set the orientation of the display to one of ``0``, ``90``, ``180`` or
@@ -106,6 +339,7 @@ class Display(ABC):
         if orientation not in (0, 90, 180, 270):
             raise ValueError("Bad orientation: %s" % (orientation,))
         self._orientation = orientation
+        self._orient      = self._orienter(orientation)
 
 
     def quit(self) -> None:
@@ -116,26 +350,34 @@ class Display(ABC):
         self.show()
 
 
-    def _orient(self,
-                x : int,
-                y : int) -> Tuple[int,int]:
-        """
-        Give back the x and y values according to the orientation value.
-        """
-        if   self._orientation ==   0:
-            return (x,
-                    y)
-        elif self._orientation ==  90:
-            return (y,
-                    x)
-        elif self._orientation == 180:
-            return (self._image.width  - x,
-                    self._image.height - y)
-        elif self._orientation == 270:
-            return (self._image.width  - y,
-                    self._image.height - x)
+    def _orienter(self,
+                  orientation : int) -> Callable[[int,int],Tuple[int,int]]:
+        """
+        Create the function which gives back the x and y values according to
+        the given orientation value. This is what `_orient` is set to. We work
+        it out once up front, since it's called for every pixel.
+
+        The function works on arrays of x and y values too, so the
+        `set_many` implementations transform all their coordinates with a
+        single call.
+        """
+        if   orientation ==   0:
+            return lambda x, y: (x,
+                                 y)
+        elif orientation ==  90:
+            return lambda x, y: (y,
+                                 x)
+
+        # The rest need the shape
+        (w, h) = self.get_shape()
+        if   orientation == 180:
+            return lambda x, y: (w - x,
+                                 h - y)
+        elif orientation == 270:
+            return lambda x, y: (w - y,
+                                 h - x)
         else:
-            raise ValueError("Bad orientation: %s" % (self._orientation,))
+            raise ValueError("Bad orientation: %s" % (orientation,))
 
 
 class NullDisplay(Display):
@@ -169,6 +411,15 @@ class NullDisplay(Display):
         pass
 
 
+    def set_many(self,
+                 xs: numpy.ndarray,
+                 ys: numpy.ndarray,
+                 rs: numpy.ndarray,
+                 gs: numpy.ndarray,
+                 bs: numpy.ndarray) -> None:
+        pass
+
+
     def show(self):
         pass
 
@@ -209,21 +460,29 @@ class Canvas():
         self._x_sz    = width
         self._y_sz    = height
         self._display = display
-        self._scale   = min(display.width  / width,
-                            display.height / height)
+        self._dx_sz   = display.width
+        self._dy_sz   = display.height
+        self._scale   = min(self._dx_sz / width,
+                            self._dy_sz / height)
 
         # The canvas is the RGB value of each _display_ pixel and what fraction of it has
-        # been painted
-        self._canvas  = numpy.zeros(shape=(display.width, display.height, 4),
-                                    dtype=numpy.float64)
+        # been painted. Each of these is held in its own plane, all of which
+        # live in a single float32 block so that they are small and close
+        # together in memory.
+        shape = (self._dx_sz, self._dy_sz)
+        self._planes = numpy.zeros(shape=(4, *shape),
+                                   dtype=numpy.float32,
+                                   order='C')
+        (self._r, self._g, self._b, self._f) = self._planes
+
+        # Which of the display pixels have been changed since the last time we
+        # flushed the canvas to the display
+        self._dirty = numpy.zeros(shape=shape, dtype=bool)
 
         # Wrapping?
         self._xwrap = xwrap
         self._ywrap = ywrap
 
-        # Hidden debugging toggle. See below for why.
-        self._debug = False
-
 
     @property
     def width(self) -> int:
@@ -246,7 +505,8 @@ class Canvas():
         Clear the canvas contents.
         """
         self._display.clear()
-        self._canvas[:,:,:] = 0.0
+        self._planes.fill(0.0)
+        self._dirty.fill(False)
 
 
     def set(self,
@@ -267,19 +527,38 @@ class Canvas():
         :param g: The green value, ``[0,1]``.
         :param b: The blue value, ``[0,1]``.
         :param s: The pixel size.
+
+        Changes are only pushed to the display when `show` is called.
         """
         # This code needs to be fast so we have a few optimisations:
         #  o Avoid transient tuple creation
         #  o Local versions of constants
         #  o Avoid function calls
 
-        if self._debug:
+        if _DEBUG:
             logging.debug(f'x={x} y={y} r={r} g={g} b={b} s={s}')
 
+        # If the canvas and the display are the same size then we can be
+        # quick about the common case of setting a single, whole, pixel
+        if s == 1.0 and self._scale == 1.0 and \
+           0 <= x < self._dx_sz            and \
+           0 <= y < self._dy_sz            and \
+           int(x) == x and int(y) == y:
+            self._set_direct(int(x),
+                             int(y),
+                             0.0 if not r >= 0.0 else (1.0 if r > 1.0 else r),
+                             0.0 if not g >= 0.0 else (1.0 if g > 1.0 else g),
+                             0.0 if not b >= 0.0 else (1.0 if b > 1.0 else b))
+            return
+
         # Local handles on a few things which we use a lot
-        width  = self._display.width
-        height = self._display.height
-        canvas = self._canvas
+        width  = self._dx_sz
+        height = self._dy_sz
+        cr     = self._r
+        cg     = self._g
+        cb     = self._b
+        cf     = self._f
+        dirty  = self._dirty
         xwrap  = self._xwrap
         ywrap  = self._ywrap
 
@@ -291,10 +570,13 @@ class Canvas():
         # Determine the display's coordinates
         dx = x * self._scale
         dy = y * self._scale
-        dr = r if 0 <= r <= 1 else min(max(0.0, r), 1.0)
-        dg = g if 0 <= g <= 1 else min(max(0.0, g), 1.0)
-        db = b if 0 <= b <= 1 else min(max(0.0, b), 1.0)
-        if self._debug:
+
+        # Clamp the colour. This is written so that NaNs, which fail every
+        # comparison, become zero.
+        dr = 0.0 if not r >= 0.0 else (1.0 if r > 1.0 else r)
+        dg = 0.0 if not g >= 0.0 else (1.0 if g > 1.0 else g)
+        db = 0.0 if not b >= 0.0 else (1.0 if b > 1.0 else b)
+        if _DEBUG:
             logging.debug(f'dx={dx} dy={dy} dr={dr} dg={dg} db={db} scale={scale}')
 
         # See if we have the simple case of direct setting
@@ -302,67 +584,21 @@ class Canvas():
            int(dx) == dx and int(dy) == dy and \
            0 <= dx < width   and \
            0 <= dy < height:
-            # Remember and set everything directly
-            dx = int(dx)
-            dy = int(dy)
-            pixel = canvas[dx][dy]
-            pixel[0] = dr
-            pixel[1] = dg
-            pixel[2] = db
-            pixel[3] = 1.0
-            self._display.set(dx, dy, dr, dg, db)
+            self._set_direct(int(dx), int(dy), dr, dg, db)
 
         elif scale < 1.0     and \
              0 <= dx < width and \
              0 <= dy < height:
             # Drawing a subpixel, we can try to be quick about this. This is
-            # just the code from the inner loop below but pulled out
+            # just the inner loop below for a single pixel, and it does the
+            # same blend via _blend_pixel().
             px = int(dx)
             py = int(dy)
-            pixel = canvas[px][py]
-            pr = pixel[0]
-            pg = pixel[1]
-            pb = pixel[2]
-            pf = pixel[3]
 
             # The area we are drawing, and hence the factor, is the size of the
             # pixel, which is the scale^2.
-            factor = scale**2
-
-            # Account for the fact that the area might not have been
-            # fully painted previously
-            factor1 = 1.0 - factor
-            if pf == 0.0 or pf <= factor1:
-                # This is a straight addition since we're not "taking
-                # away" from the existing space. E.g. if we'd only
-                # painted 0.1 of the canvas before and now we're
-                # painting 0.7 then there's still 0.2 of unaccounted for
-                # space.
-                pr = pr + factor * dr
-                pg = pg + factor * dg
-                pb = pb + factor * db
-                pf = factor + pf
-            else:
-                # Okay, here we're taking away from what was there
-                # before. We account for this by scaling the existing
-                # colour into the same space before we take the weighted
-                # average. We fold this into the factor1 value to save
-                # multiple divides. Here pf can't be zero since we
-                # checked above.
-                pfactor1 = factor1 / pf
-                pr = min(pfactor1 * pr + factor * dr, 1.0)
-                pg = min(pfactor1 * pg + factor * dg, 1.0)
-                pb = min(pfactor1 * pb + factor * db, 1.0)
-                pf = 1.0 # <-- fully painted now
-
-            # Remember
-            pixel[0] = pr if pr < 1.0 else 1.0
-            pixel[1] = pg if pg < 1.0 else 1.0
-            pixel[2] = pb if pb < 1.0 else 1.0
-            pixel[3] = pf if pf < 1.0 else 1.0
-
-            # And, finally, push those values to the display itself!
-            self._display.set(px, py, pr, pg, pb)
+            _blend_pixel(cr, cg, cb, cf, px, py, dr, dg, db, scale**2)
+            dirty[px, py] = True
 
         else:
             # Okay, we're going to paint a fractional square which is centered
@@ -377,114 +613,85 @@ class Canvas():
             #
             # So a scale of 2 at 5,5 means (5,5) to (6,6). A scale of 3 means
             # (4,4) to (6,6). Of 4 means (4,4) to (7,7). And so on.
-            half = max(0.0, (scale - 1.0) / 2.0)
-            if int(scale) & 1:
-                # Odd scale grows right with the fraction
-                l_off = int(half)
-                r_off = scale - l_off
-            else:
-                # Even grows left
-                r_off = int(half)
-                l_off = scale - r_off
+            (l_off, r_off) = _offsets(scale)
             dxl = dx - l_off
             dxr = dx + r_off
             dyt = dy - l_off
             dyb = dy + r_off
 
             # Walk each pixel and compute the fraction, then set
-            if self._debug:
+            if _DEBUG:
                 logging.debug(f'px=[{dxl},{dxr}] py=[{dyt},{dyb}]')
-            for px_ in range(int(dxl), int(dxr) + 1):
-                for py_ in range(int(dyt), int(dyb) + 1):
-                    # Copy, since we noodle these
-                    px = px_
-                    py = py_
-
-                    # See how we are clipping the value, to determine the pixel
-                    # area. Since the area of a pixel is 1x1=1 the area here is
-                    # also the fraction. Here the far corner of the pixel is the
-                    # near corner of the adjacent pixel, when it comes to
-                    # computing the area.
-                    cxl  = max(dxl, px+0)
-                    cxr  = min(dxr, px+1)
-                    cyt  = max(dyt, py+0)
-                    cyb  = min(dyb, py+1)
-                    area = abs(cxr - cxl) * abs(cyb - cyt)
-
-                    # The blending factor is the area of the display pixel
-                    # covered. 0 means none and 1.0 means all. If this factor
-                    # is non-postive then we have nothing to do.
-                    factor = area
-                    if factor <= 0.0:
-                        continue
-                    if factor > 1.0:
-                        factor = 1.0
-
-                    # Now noodle the pixel x,y if we are wrapping. Else we bail
-                    # if it's out of bounds.
-                    if px < 0 or px >= width:
-                        if xwrap:
-                            if px < 0:
-                                px += width
-                            else:
-                                px -= width
-                        else:
-                            continue
-                    if py < 0 or py >= height:
-                        if ywrap:
-                            if py < 0:
-                                py += height
-                            else:
-                                py -= height
-                        else:
-                            continue
-
-                    # Finally we can now set it. We do this by blending with
-                    # what was there before.
-                    pixel = canvas[px][py]
-                    pr = pixel[0]
-                    pg = pixel[1]
-                    pb = pixel[2]
-                    pf = pixel[3]
-                    if self._debug:
-                        logging.debug(
-                            f'px={px} py={py} pr={pr} pg={pg} pb={pb} pf={pf} factor={factor}'
-                        )
-
-                    # Account for the fact that the area might not have been
-                    # fully painted previously
-                    factor1 = 1.0 - factor
-                    if pf == 0.0 or pf <= factor1:
-                        # This is a straight addition since we're not "taking
-                        # away" from the existing space. E.g. if we'd only
-                        # painted 0.1 of the canvas before and now we're
-                        # painting 0.7 then there's still 0.2 of unaccounted for
-                        # space.
-                        pr = pr + factor * dr
-                        pg = pg + factor * dg
-                        pb = pb + factor * db
-                        pf = factor + pf
-                    else:
-                        # Okay, here we're taking away from what was there
-                        # before. We account for this by scaling the existing
-                        # colour into the same space before we take the weighted
-                        # average. We fold this into the factor1 value to save
-                        # multiple divides. Here pf can't be zero since we
-                        # checked above.
-                        pfactor1 = factor1 / pf
-                        pr = min(pfactor1 * pr + factor * dr, 1.0)
-                        pg = min(pfactor1 * pg + factor * dg, 1.0)
-                        pb = min(pfactor1 * pb + factor * db, 1.0)
-                        pf = 1.0 # <-- fully painted now
-
-                    # Remember
-                    pixel[0] = pr if pr < 1.0 else 1.0
-                    pixel[1] = pg if pg < 1.0 else 1.0
-                    pixel[2] = pb if pb < 1.0 else 1.0
-                    pixel[3] = pf if pf < 1.0 else 1.0
-
-                    # And, finally, push those values to the display itself!
-                    self._display.set(px, py, pr, pg, pb)
+            _blend_square(cr, cg, cb, cf, dirty,
+                          dxl, dxr, dyt, dyb,
+                          dr, dg, db,
+                          xwrap, ywrap)
+
+
+    def set_many(self,
+                 xs: numpy.ndarray,
+                 ys: numpy.ndarray,
+                 rs: numpy.ndarray,
+                 gs: numpy.ndarray,
+                 bs: numpy.ndarray,
+                 s : float = 1.0) -> None:
+        """
+        Set the values of many pixels at once, all of the same size. This is
+        the same as calling `set` for each of them in turn.
+
+        :param xs: The x coordinates.
+        :param ys: The y coordinates.
+        :param rs: The red values, ``[0,1]``.
+        :param gs: The green values, ``[0,1]``.
+        :param bs: The blue values, ``[0,1]``.
+        :param s:  The pixel size.
+        """
+        set_ = self.set
+        for (x, y, r, g, b) in zip(numpy.asarray(xs).tolist(),
+                                   numpy.asarray(ys).tolist(),
+                                   numpy.asarray(rs).tolist(),
+                                   numpy.asarray(gs).tolist(),
+                                   numpy.asarray(bs).tolist()):
+            set_(x, y, r, g, b, s)
+
+
+    def _set_direct(self,
+                    dx: int,
+                    dy: int,
+                    dr: float,
+                    dg: float,
+                    db: float) -> None:
+        """
+        Set the display pixel at the given coordinates to the given colour,
+        replacing what was there. The values must already be in range.
+        """
+        cr = self._r
+        cg = self._g
+        cb = self._b
+        cf = self._f
+
+        # The planes hold float32 values so that's what we compare against.
+        # (Under older versions of numpy comparing a float32 with a Python
+        # float is done at double precision, so would rarely match.)
+        dr = numpy.float32(dr)
+        dg = numpy.float32(dg)
+        db = numpy.float32(db)
+
+        # If the pixel is already fully painted with this colour then there's
+        # nothing to do, and nothing to send to the display. This is common
+        # when redrawing mostly static frames.
+        if cf[dx, dy] == 1.0 and \
+           cr[dx, dy] == dr  and \
+           cg[dx, dy] == dg  and \
+           cb[dx, dy] == db:
+            return
+
+        # Else set everything directly
+        cr[dx, dy] = dr
+        cg[dx, dy] = dg
+        cb[dx, dy] = db
+        cf[dx, dy] = 1.0
+        self._dirty[dx, dy] = True
 
 
     def set_image(self,
@@ -492,7 +699,8 @@ class Canvas():
         """
         Display the given image on the display.
 
-        This isn't too fast right now.
+        This is only really fast when the image is no smaller than the display,
+        and is the same size as it in at least one dimension.
         """
         # Get the relative dimensions
         (dw, dh) = self._display.get_shape()
@@ -511,29 +719,99 @@ class Canvas():
         if sz > 1:
             sz = math.ceil(sz)
 
-        # Now draw it into the display
-        for ix in range(iw):
-            for iy in range(ih):
-                # Get the display coordinates
-                dx = round(ix * sw)
-                dy = round(iy * sh)
-
-                # Copy out the RGB value we want to set
-                rgb = image.getpixel((ix, iy))
-
-                # And set!
-                self.set(dx,
-                         dy,
-                         rgb[0] / 255,
-                         rgb[1] / 255,
-                         rgb[2] / 255,
-                         sz)
+        # Pull out the image as an array of RGB values in [0,1], indexed as
+        # [y,x], along with where each image pixel lands on the display
+        rgb = numpy.asarray(image.convert('RGB'),
+                            dtype=numpy.float32) * (1.0 / 255.0)
+        dxs = numpy.round(numpy.arange(iw) * sw).astype(numpy.intp)
+        dys = numpy.round(numpy.arange(ih) * sh).astype(numpy.intp)
+
+        # If each image pixel maps onto (at most) a single display pixel then we
+        # can just copy them straight in, else we have to do it a pixel at a
+        # time
+        if sz == 1.0 and self._scale == 1.0:
+            # Wrap or drop the ones which are off the display. Since the image
+            # grid is separable we can do this for each axis independently.
+            if self._xwrap:
+                dxs %= dw
+            if self._ywrap:
+                dys %= dh
+            xvalid = (0 <= dxs) & (dxs < dw)
+            yvalid = (0 <= dys) & (dys < dh)
+            rgb = rgb[yvalid][:,xvalid]
+
+            # Now copy them in. If several image pixels land on the same
+            # display pixel then the last one wins, just like it does with
+            # set().
+            index = (dxs[xvalid][:,None], dys[yvalid][None,:])
+            self._r    [index] = rgb[:,:,0].T
+            self._g    [index] = rgb[:,:,1].T
+            self._b    [index] = rgb[:,:,2].T
+            self._f    [index] = 1.0
+            self._dirty[index] = True
+        else:
+            dxs = dxs.tolist()
+            dys = dys.tolist()
+            rgb = rgb.tolist()
+            for ix in range(iw):
+                dx = dxs[ix]
+                for iy in range(ih):
+                    (r, g, b) = rgb[iy][ix]
+                    self.set(dx, dys[iy], r, g, b, sz)
+
+
+    def blit_rgb(self,
+                 rgb: numpy.ndarray) -> None:
+        """
+        Replace the whole display with the given RGB values, in one go.
+
+        Unlike `set_image` this does not preserve the aspect ratio; the values
+        are stretched to fill the display, if they are not already the same
+        size as it.
+
+        :param rgb: The RGB bytes, as an array with the shape
+                    ``(height, width, 3)``, like the one which
+                    ``numpy.asarray(image.convert('RGB'))`` gives back.
+        """
+        rgb = numpy.asarray(rgb, dtype=numpy.uint8)
+        if rgb.ndim != 3 or rgb.shape[2] != 3:
+            raise ValueError("Bad RGB shape: %s" % (rgb.shape,))
+
+        # Get it to the size of the display. Nearest-neighbour is the cheapest
+        # way to do this and doesn't blur things.
+        if rgb.shape[:2] != (self._dy_sz, self._dx_sz):
+            rgb = numpy.asarray(
+                Image.fromarray(rgb, 'RGB').resize((self._dx_sz, self._dy_sz),
+                                                   Image.NEAREST)
+            )
+
+        # Turn it into [0,1] planes, indexed as [x,y] like ours are
+        (r, g, b) = rgb.transpose(2, 1, 0) * numpy.float32(1.0 / 255.0)
+
+        # Only the pixels which actually change need sending to the display
+        self._dirty |= ((self._f != 1.0) |
+                        (self._r != r  ) |
+                        (self._g != g  ) |
+                        (self._b != b  ))
+        self._r[:,:] = r
+        self._g[:,:] = g
+        self._b[:,:] = b
+        self._f[:,:] = 1.0
 
 
     def show(self):
         """
         Flush any `set` calls to the display.
         """
+        # Push all the pixels which we changed to the display in one go, and
+        # then show them
+        (xs, ys) = numpy.nonzero(self._dirty)
+        if len(xs) > 0:
+            self._display.set_many(xs, ys,
+                                   self._r[xs, ys],
+                                   self._g[xs, ys],
+                                   self._b[xs, ys])
+            self._dirty[:,:] = False
         self._display.show()
 
 
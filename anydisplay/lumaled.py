@@ -2,6 +2,7 @@
 LUMA LED matrix displays.
 """
 
+from   PIL    import Image
 from   typing import Tuple
 from   .      import Display
 
@@ -61,11 +62,36 @@ class MAX7219(Display):
             v = (r * 0.299 +
                  g * 0.587 +
                  b * 0.114)
-            self._bitmap[dx][dy] = v >= 0.5
+            self._bitmap[dx, dy] = v >= 0.5
+
+
+    def set_many(self,
+                 xs: numpy.ndarray,
+                 ys: numpy.ndarray,
+                 rs: numpy.ndarray,
+                 gs: numpy.ndarray,
+                 bs: numpy.ndarray) -> None:
+        # Ensure that they are correctly oriented
+        (dxs, dys) = self._orient(numpy.asarray(xs), numpy.asarray(ys))
+
+        # Only keep the ones which are on the display
+        valid = ((0 <= dxs) & (dxs < self._device.width ) &
+                 (0 <= dys) & (dys < self._device.height))
+
+        # Convert them all to gray and then booleans in one go
+        v = (numpy.asarray(rs) * 0.299 +
+             numpy.asarray(gs) * 0.587 +
+             numpy.asarray(bs) * 0.114)
+        self._bitmap[dxs[valid], dys[valid]] = v[valid] >= 0.5
 
 
     def show(self):
+        # Turn the bitmap into a monochrome image in one go, instead of drawing
+        # it a point at a time. The bitmap is indexed as [x,y] so we transpose
+        # it to get the rows, which packbits() pads out to whole bytes like PIL
+        # expects.
+        (w, h) = self._bitmap.shape
+        packed = numpy.packbits(self._bitmap.T, axis=1, bitorder='big')
+        image  = Image.frombytes('1', (w, h), packed.tobytes())
         with self._canvas(self._device) as draw:
-            for x in range(self._device.width):
-                for y in range(self._device.height):
-                    draw.point((x, y), int(self._bitmap[x][y]))
+            draw.bitmap((0, 0), image, fill=1)
@@ -6,6 +6,8 @@ from   PIL    import Image
 from   typing import Tuple
 from   .      import Display
 
+import numpy
+
 # ----------------------------------------------------------------------
 
 class _PIL(Display):
@@ -24,10 +26,12 @@ class _PIL(Display):
         self._image = Image.new('RGB',
                                 (int(width), int(height)),
                                 color=(0,0,0))
-        self._clear = (b'\x00' *
-                       self._image.width *
-                       self._image.height *
-                       3)
+
+        # We draw into this array and then copy it into the image, in one go,
+        # when it comes time to show it. This is much faster than calling
+        # putpixel() on the image for each pixel.
+        self._pixels = numpy.zeros((self._image.height, self._image.width, 3),
+                                   dtype=numpy.uint8)
 
 
     def get_shape(self) -> Tuple[int,int]:
@@ -35,7 +39,7 @@ class _PIL(Display):
 
 
     def clear(self):
-        self._image.frombytes(self._clear)
+        self._pixels.fill(0)
 
 
     def set(self,
@@ -50,12 +54,38 @@ class _PIL(Display):
         # Bounds check since the call with throw otherwise
         if 0 <= dx < self._image.width and 0 <= dy < self._image.height:
             # Okay to set
-            self._image.putpixel(
-                (dx, dy),
-                (int(255 * min(max(r, 0.0), 1.0)),
-                 int(255 * min(max(g, 0.0), 1.0)),
-                 int(255 * min(max(b, 0.0), 1.0)))
-            )
+            self._pixels[dy, dx] = (int(255 * min(max(r, 0.0), 1.0)),
+                                    int(255 * min(max(g, 0.0), 1.0)),
+                                    int(255 * min(max(b, 0.0), 1.0)))
+
+
+    def set_many(self,
+                 xs: numpy.ndarray,
+                 ys: numpy.ndarray,
+                 rs: numpy.ndarray,
+                 gs: numpy.ndarray,
+                 bs: numpy.ndarray) -> None:
+        # Ensure that they are correctly oriented
+        (dxs, dys) = self._orient(numpy.asarray(xs), numpy.asarray(ys))
+
+        # Only keep the ones which are on the display
+        valid = ((0 <= dxs) & (dxs < self._image.width ) &
+                 (0 <= dys) & (dys < self._image.height))
+        rgb = numpy.stack((rs, gs, bs), axis=-1)[valid]
+
+        # And splat them all in
+        self._pixels[dys[valid], dxs[valid]] = \
+            (255 * numpy.clip(rgb, 0.0, 1.0)).astype(numpy.uint8)
+
+
+    def _flush_image(self) -> Image:
+        """
+        Copy the pixels which we have been drawing into the image.
+
+        :return: The updated image.
+        """
+        self._image.frombytes(self._pixels.tobytes())
+        return self._image
 
 
 class ST7789TFT(_PIL):
@@ -95,7 +125,7 @@ class ST7789TFT(_PIL):
 
 
     def show(self) -> None:
-        self._display.display(self._image)
+        self._display.display(self._flush_image())
 
 
     def quit(self) -> None:
@@ -140,7 +170,7 @@ class _MiniPiTFT(_PIL):
 
 
     def show(self) -> None:
-        self._display.image(self._image, self._rotation)
+        self._display.image(self._flush_image(), self._rotation)
 
 
     def quit(self) -> None:
@@ -219,7 +249,7 @@ class I2CPiOLED(_PIL):
 
 
     def show(self) -> None:
-        mono = self._image.convert('1', dither=self._dither)
+        mono = self._flush_image().convert('1', dither=self._dither)
         self._display.image(mono)
         self._display.show()
 
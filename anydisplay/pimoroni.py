@@ -5,7 +5,7 @@ Pimoroni displays.
 from   typing import Tuple
 from   .      import Display
 
-import math
+import numpy
 
 # ----------------------------------------------------------------------
 
@@ -20,14 +20,19 @@ class _UnicornHat(Display):
         self._display = display
         self._brightness(min(max(brightness, 0.0), 1.0))
 
+        # Remember the shape since we need it for every set() call. This can
+        # change with the orientation on non-square displays.
+        (self._w, self._h) = display.get_shape()
+
 
     def get_shape(self) -> Tuple[int,int]:
-        return self._display.get_shape()
+        return (self._w, self._h)
 
 
     def set_orientation(self, orientation: int) -> None:
         super().set_orientation(orientation)
         self._display.rotation(orientation)
+        (self._w, self._h) = self._display.get_shape()
 
 
     def clear(self):
@@ -41,8 +46,7 @@ class _UnicornHat(Display):
             g: float,
             b: float) -> None:
         # Bounds check since the call with throw otherwise
-        (w, h) = self._display.get_shape()
-        if 0 <= x < w and 0 <= y < h:
+        if 0 <= x < self._w and 0 <= y < self._h:
             # Okay to set
             self._display.set_pixel(
                 x,
@@ -80,6 +84,74 @@ class UnicornHatHD(_UnicornHat):
         import unicornhathd
         super().__init__(unicornhathd, brightness)
 
+        # The library's pixel buffer, if we can write into it. See _pixels().
+        self._buf = self._pixels()
+
+
+    def clear(self):
+        super().clear()
+        self._buf = self._pixels()
+
+
+    def set(self,
+            x: int,
+            y: int,
+            r: float,
+            g: float,
+            b: float) -> None:
+        buf = self._buf
+        if buf is None:
+            super().set(x, y, r, g, b)
+        elif 0 <= x < self._w and 0 <= y < self._h:
+            buf[x, y] = (int(255 * min(max(r, 0.0), 1.0)),
+                         int(255 * min(max(g, 0.0), 1.0)),
+                         int(255 * min(max(b, 0.0), 1.0)))
+
+
+    def set_many(self,
+                 xs: numpy.ndarray,
+                 ys: numpy.ndarray,
+                 rs: numpy.ndarray,
+                 gs: numpy.ndarray,
+                 bs: numpy.ndarray) -> None:
+        buf = self._buf = self._pixels()
+        if buf is None:
+            super().set_many(xs, ys, rs, gs, bs)
+        else:
+            # Only keep the ones which are on the display and splat them in
+            xs = numpy.asarray(xs)
+            ys = numpy.asarray(ys)
+            valid = ((0 <= xs) & (xs < self._w) &
+                     (0 <= ys) & (ys < self._h))
+            rgb = numpy.stack((rs, gs, bs), axis=-1)[valid]
+            buf[xs[valid], ys[valid]] = \
+                (255 * numpy.clip(rgb, 0.0, 1.0)).astype(numpy.uint8)
+
+
+    def show(self):
+        super().show()
+        self._buf = self._pixels()
+
+
+    def _pixels(self):
+        """
+        Get the library's pixel buffer, if we can write into it, else ``None``.
+
+        The library holds its pixels in a NumPy array, indexed as ``[x,y]``,
+        which it renders from in ``show()``. Writing into this directly is much
+        faster than calling ``set_pixel()`` for each pixel. The library replaces
+        it in ``setup_buffer()`` so we refetch it in `clear`, `show` and
+        `set_many`, rather than for every `set` call.
+        """
+        get_pixels = getattr(self._display, 'get_pixels', None)
+        if get_pixels is None:
+            return None
+        buf = get_pixels()
+        if isinstance(buf, numpy.ndarray) and buf.shape == (self._w, self._h, 3):
+            return buf
+        else:
+            return None
+
 
 class UnicornHatMini(_UnicornHat):
     """
@@ -114,8 +186,7 @@ class UnicornScrollHatMini(_UnicornHat):
             g: float,
             b: float) -> None:
         # Bounds check since the call with throw otherwise
-        (w, h) = self._display.get_shape()
-        if 0 <= x < w and 0 <= y < h:
+        if 0 <= x < self._w and 0 <= y < self._h:
             # Okay to set. We need to turn the colours into a brightness since
             # the HAT is grey-scale only. We use ITU-R 601-2 luma transform for
             # this.
@@ -124,6 +195,6 @@ class UnicornScrollHatMini(_UnicornHat):
                  b * 0.114)
 
             # And set
-            self._display.pixel(x, y, min(max(v, 0.0), 1.0))
+            self._display.pixel(x, y, 1.0 if v >= 1.0 else (0.0 if v <= 0.0 else v))
 
         
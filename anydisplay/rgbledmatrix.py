@@ -2,11 +2,21 @@
 LED matrix displays.
 """
 
+from   PIL    import Image
 from   typing import Tuple
 from   .      import Display
 
+import logging
+import numpy
+import queue
+import threading
+
 # ----------------------------------------------------------------------
 
+# How long, in seconds, quit() waits for the frame thread to finish
+_QUIT_TIMEOUT = 5.0
+
+
 class RGBLEDMatrix(Display):
     """
     A RGB LED matrix, driven by the Pi RGB LED Matrix software.
@@ -34,13 +44,42 @@ class RGBLEDMatrix(Display):
         self._matrix = RGBMatrix(options=options)
         self._canvas = self._matrix.CreateFrameCanvas()
 
+        # Remember the size since we need it for every set() call
+        (self._w, self._h) = (self._matrix.width, self._matrix.height)
+
+        # We draw into this and then hand it over as an image, in one go, when
+        # we show it. This is much faster than calling SetPixel() for each
+        # pixel.
+        self._fb = numpy.zeros((self._h, self._w, 3),
+                               dtype=numpy.uint8)
+
+        # SwapOnVSync() blocks until the panel is refreshed so we hand the
+        # frames off to a thread which does that for us. The queue only holds
+        # the latest frame; if the thread hasn't picked up the previous one by
+        # the time we have a new one then the old one is dropped.
+        self._frames = queue.Queue(maxsize=1)
+
+        # The images which we hand to the thread. We reuse these, rather than
+        # creating a new one each frame, and there are enough of them for one
+        # to be being drawn by the thread, one to be waiting in the queue, and
+        # one to be filled in by show(). (PIL holds RGB images with a padding
+        # byte per pixel so they can't share the framebuffer's memory.)
+        self._free = queue.Queue()
+        for _ in range(3):
+            self._free.put(Image.new('RGB', (self._w, self._h)))
+
+        self._thread = threading.Thread(target=self._pump,
+                                         name='RGBLEDMatrix',
+                                         daemon=True)
+        self._thread.start()
+
 
     def get_shape(self) -> Tuple[int,int]:
-        return (self._matrix.width, self._matrix.height)
+        return (self._w, self._h)
 
 
     def clear(self):
-        self._canvas.Clear()
+        self._fb.fill(0)
 
 
     def set(self,
@@ -53,16 +92,91 @@ class RGBLEDMatrix(Display):
         (dx, dy) = self._orient(x, y)
 
         # Bounds check since the call with throw otherwise
-        if 0 <= dx < self._matrix.width and 0 <= dy < self._matrix.height:
+        if 0 <= dx < self._w and 0 <= dy < self._h:
             # Okay to set
-            self._canvas.SetPixel(
-                dx,
-                dy,
-                int(255 * min(max(r, 0.0), 1.0)),
-                int(255 * min(max(g, 0.0), 1.0)),
-                int(255 * min(max(b, 0.0), 1.0))
-            )
+            self._fb[dy, dx] = (int(255 * min(max(r, 0.0), 1.0)),
+                                int(255 * min(max(g, 0.0), 1.0)),
+                                int(255 * min(max(b, 0.0), 1.0)))
+
+
+    def set_u8(self,
+               x: int,
+               y: int,
+               r: int,
+               g: int,
+               b: int) -> None:
+        # Ensure that they are correctly oriented
+        (dx, dy) = self._orient(x, y)
+
+        # Bounds check since the call with throw otherwise
+        if 0 <= dx < self._w and 0 <= dy < self._h:
+            # Okay to set, the values are already what we store
+            self._fb[dy, dx] = (r, g, b)
+
+
+    def set_many(self,
+                 xs: numpy.ndarray,
+                 ys: numpy.ndarray,
+                 rs: numpy.ndarray,
+                 gs: numpy.ndarray,
+                 bs: numpy.ndarray) -> None:
+        # Ensure that they are correctly oriented
+        (dxs, dys) = self._orient(numpy.asarray(xs), numpy.asarray(ys))
+
+        # Only keep the ones which are on the display
+        valid = ((0 <= dxs) & (dxs < self._w) &
+                 (0 <= dys) & (dys < self._h))
+        rgb = numpy.stack((rs, gs, bs), axis=-1)[valid]
+
+        # And splat them all in
+        self._fb[dys[valid], dxs[valid]] = \
+            (255 * numpy.clip(rgb, 0.0, 1.0)).astype(numpy.uint8)
 
 
     def show(self):
-        self._canvas = self._matrix.SwapOnVSync(self._canvas)
+        # Copy the framebuffer into a spare image and replace any frame which
+        # the thread has yet to pick up with it
+        frame = self._free.get()
+        frame.frombytes(self._fb)
+        try:
+            self._free.put(self._frames.get_nowait())
+        except queue.Empty:
+            pass
+        self._frames.put_nowait(frame)
+
+
+    def quit(self):
+        # Nothing to do if we have already been shut down
+        if not self._thread.is_alive():
+            return
+
+        # This will queue up the final, cleared, frame. We wait for that to be
+        # picked up and then tell the thread to stop. We don't wait forever in
+        # case the thread is wedged in the matrix library.
+        super().quit()
+        try:
+            self._frames.put(None, timeout=_QUIT_TIMEOUT)
+        except queue.Full:
+            logging.warning("Timed out stopping the RGBLEDMatrix thread")
+            return
+        self._thread.join(_QUIT_TIMEOUT)
+
+
+    def _pump(self):
+        """
+        Push frames from the queue to the matrix, until we get a ``None``.
+        """
+        while True:
+            frame = self._frames.get()
+            if frame is None:
+                return
+
+            # Don't let a bad frame kill the thread, else nothing would be
+            # left to drain the queue
+            try:
+                self._canvas.SetImage(frame, 0, 0)
+                self._canvas = self._matrix.SwapOnVSync(self._canvas)
+            except Exception:
+                logging.exception("Failed to display frame")
+            finally:
+                self._free.put(frame)
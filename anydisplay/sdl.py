@@ -5,8 +5,15 @@ LED matrix displays.
 from   typing import Tuple
 from   .      import Display
 
+import ctypes
+import numpy
+
 # ----------------------------------------------------------------------
 
+# The alpha part of a packed, opaque, RGBA pixel value
+_OPAQUE = 0xFF000000
+
+
 class SDL(Display):
     """
     Use SDL 2.0 to display images.
@@ -19,13 +26,18 @@ class SDL(Display):
                  name          : str  = '',
                  width         : int  = 800,
                  height        : int  = 600,
-                 full_screen   : bool = False):
+                 full_screen   : bool = False,
+                 vsync         : bool = False):
         """
         :param name:        The name of the created window/display.
         :param width:       The width.
         :param height:      The height.
         :param full_screen: Whether the display should be full screen or, else,
                             in a window.
+        :param vsync:       Whether `show` should wait for the monitor's
+                            vertical refresh. This avoids tearing but means
+                            that `show` blocks for up to a frame, and caps the
+                            framerate at the monitor's refresh rate.
         """
         super().__init__()
 
@@ -43,19 +55,54 @@ class SDL(Display):
         if full_screen:
             flags |= sdl2.SDL_WINDOW_FULLSCREEN
 
+        # Renderer creation flags
+        renderer_flags = sdl2.SDL_RENDERER_ACCELERATED
+        if vsync:
+            renderer_flags |= sdl2.SDL_RENDERER_PRESENTVSYNC
+
         # Create the window and the associated render
         self._window = sdl2.ext.Window(str(name),
                                        size=(width, height),
                                        flags=flags)
-        self._renderer = sdl2.ext.Renderer(self._window)
+        self._renderer = sdl2.ext.Renderer(self._window,
+                                           flags=renderer_flags)
+
+        # Remember the size since we need it for every set() call
+        (self._w, self._h) = self._window.size
+
+        # We draw into an RGBA framebuffer and then upload that to a texture,
+        # in one go, when we show it. This is much faster than drawing each
+        # point with the renderer. The alpha channel is always opaque.
+        self._fb = numpy.zeros((self._h, self._w, 4), dtype=numpy.uint8)
+        self._fb[:,:,3] = 255
+
+        # A view of the framebuffer with each pixel as a single packed 32bit
+        # value, so that we can set a pixel with a single store. The bytes are
+        # in R,G,B,A order so this is always a little-endian view, whatever
+        # the machine is.
+        self._fb32 = self._fb.view('<u4').reshape(self._h, self._w)
+
+        # The texture which we upload the framebuffer to
+        self._texture = sdl2.SDL_CreateTexture(self._renderer.sdlrenderer,
+                                               sdl2.SDL_PIXELFORMAT_RGBA32,
+                                               sdl2.SDL_TEXTUREACCESS_STREAMING,
+                                               self._w,
+                                               self._h)
+
+        # The bounding box of the framebuffer which has changed since we last
+        # uploaded it to the texture, as inclusive ``[x0, y0, x1, y1]``
+        # values. This is ``None`` if nothing has changed. To start with, the
+        # texture contents are undefined so everything needs uploading.
+        self._dirty = [0, 0, self._w - 1, self._h - 1]
 
 
     def get_shape(self) -> Tuple[int,int]:
-        return self._window.size
+        return (self._w, self._h)
 
 
     def clear(self):
-        self._renderer.clear()
+        self._fb32.fill(_OPAQUE)
+        self._dirty = [0, 0, self._w - 1, self._h - 1]
 
 
     def set(self,
@@ -68,18 +115,120 @@ class SDL(Display):
         (dx, dy) = self._orient(x, y)
 
         # Bounds check since the call with throw otherwise
-        (max_x, max_y) = self._window.size
-        if 0 <= dx < max_x and 0 <= dy < max_y:
+        if 0 <= dx < self._w and 0 <= dy < self._h:
             # Okay to set
-            self._renderer.draw_point(
-                (dx, dy),
-                self._sdl2_ext.Color(
-                    int(255 * min(max(r, 0.0), 1.0)),
-                    int(255 * min(max(g, 0.0), 1.0)),
-                    int(255 * min(max(b, 0.0), 1.0))
-                )
-            )
+            self._fb32[dy, dx] = ((int(255 * min(max(r, 0.0), 1.0))      ) |
+                                  (int(255 * min(max(g, 0.0), 1.0)) <<  8) |
+                                  (int(255 * min(max(b, 0.0), 1.0)) << 16) |
+                                  _OPAQUE)
+
+            # And remember that it changed
+            dirty = self._dirty
+            if dirty is None:
+                self._dirty = [dx, dy, dx, dy]
+            else:
+                if dx < dirty[0]: dirty[0] = dx
+                if dy < dirty[1]: dirty[1] = dy
+                if dx > dirty[2]: dirty[2] = dx
+                if dy > dirty[3]: dirty[3] = dy
+
+
+    def set_u8(self,
+               x: int,
+               y: int,
+               r: int,
+               g: int,
+               b: int) -> None:
+        # Ensure that they are correctly oriented
+        (dx, dy) = self._orient(x, y)
+
+        # Bounds check since the call with throw otherwise
+        if 0 <= dx < self._w and 0 <= dy < self._h:
+            # Okay to set, the values only need packing. We go via int() so
+            # that numpy byte values don't overflow when shifted.
+            self._fb32[dy, dx] = (((int(r) & 0xFF)      ) |
+                                  ((int(g) & 0xFF) <<  8) |
+                                  ((int(b) & 0xFF) << 16) |
+                                  _OPAQUE)
+
+            # And remember that it changed
+            dirty = self._dirty
+            if dirty is None:
+                self._dirty = [dx, dy, dx, dy]
+            else:
+                if dx < dirty[0]: dirty[0] = dx
+                if dy < dirty[1]: dirty[1] = dy
+                if dx > dirty[2]: dirty[2] = dx
+                if dy > dirty[3]: dirty[3] = dy
+
+
+    def set_many(self,
+                 xs: numpy.ndarray,
+                 ys: numpy.ndarray,
+                 rs: numpy.ndarray,
+                 gs: numpy.ndarray,
+                 bs: numpy.ndarray) -> None:
+        # Ensure that they are correctly oriented
+        (dxs, dys) = self._orient(numpy.asarray(xs), numpy.asarray(ys))
+
+        # Only keep the ones which are on the display
+        valid = ((0 <= dxs) & (dxs < self._w) &
+                 (0 <= dys) & (dys < self._h))
+        rgb = numpy.stack((rs, gs, bs), axis=-1)[valid]
+
+        # Pack them into pixel values and splat them all in
+        rgb = (255 * numpy.clip(rgb, 0.0, 1.0)).astype(numpy.uint32)
+        dxs = dxs[valid]
+        dys = dys[valid]
+        self._fb32[dys, dxs] = ((rgb[:,0]      ) |
+                                (rgb[:,1] <<  8) |
+                                (rgb[:,2] << 16) |
+                                _OPAQUE)
+
+        # And remember what changed
+        if len(dxs) > 0:
+            (x0, y0, x1, y1) = (int(dxs.min()), int(dys.min()),
+                                int(dxs.max()), int(dys.max()))
+            dirty = self._dirty
+            if dirty is None:
+                self._dirty = [x0, y0, x1, y1]
+            else:
+                self._dirty = [min(x0, dirty[0]), min(y0, dirty[1]),
+                               max(x1, dirty[2]), max(y1, dirty[3])]
 
 
     def show(self):
+        # Nothing to show on once we have been shut down
+        if self._texture is None:
+            return
+
+        # Upload the part of the framebuffer which changed, if any. The
+        # pixels are read from the framebuffer in place, starting at the top
+        # left of the changed area, with each row being a full framebuffer
+        # row apart.
+        if self._dirty is not None:
+            (x0, y0, x1, y1) = self._dirty
+            rect = self._sdl2.SDL_Rect(x0, y0, x1 - x0 + 1, y1 - y0 + 1)
+            (pitch, step) = self._fb.strides[:2]
+            self._sdl2.SDL_UpdateTexture(self._texture,
+                                         ctypes.byref(rect),
+                                         self._fb.ctypes.data + y0 * pitch + x0 * step,
+                                         pitch)
+            self._dirty = None
+
+        # And blit it to the window
+        self._sdl2.SDL_RenderCopy(self._renderer.sdlrenderer,
+                                  self._texture,
+                                  None,
+                                  None)
         self._renderer.present()
+
+
+    def quit(self):
+        # Nothing to do if we have already been shut down
+        if self._texture is None:
+            return
+
+        super().quit()
+        self._sdl2.SDL_DestroyTexture(self._texture)
+        self._texture = None
@@ -5,6 +5,8 @@ A display using a terminal.
 from .      import Display
 from typing import Tuple
 
+import numpy
+
 # ----------------------------------------------------------------------
 
 class Curses(Display):
@@ -108,6 +110,36 @@ class Curses(Display):
                 pass
 
 
+    def set_many(self,
+                 xs: numpy.ndarray,
+                 ys: numpy.ndarray,
+                 rs: numpy.ndarray,
+                 gs: numpy.ndarray,
+                 bs: numpy.ndarray) -> None:
+        # Ensure that they are correctly oriented
+        (dxs, dys) = self._orient(numpy.asarray(xs), numpy.asarray(ys))
+
+        # Only keep the ones which are on the display
+        valid = ((0 <= dxs) & (dxs < self._max_x) &
+                 (0 <= dys) & (dys < self._max_y))
+
+        # Determine all the colour-pairs to use in one go, just like set() does
+        pairs = (((numpy.round(self._max_r * numpy.asarray(rs)[valid]).astype(int) << 5) |
+                  (numpy.round(self._max_g * numpy.asarray(gs)[valid]).astype(int) << 2) |
+                  (numpy.round(self._max_b * numpy.asarray(bs)[valid]).astype(int)     )) & 255)
+        numpy.minimum(pairs, self._curses.COLORS-1, out=pairs)
+
+        # Curses only lets us draw one at a time
+        for (dx, dy, pair) in zip(dxs[valid].tolist(),
+                                  dys[valid].tolist(),
+                                  pairs.tolist()):
+            try:
+                self._display.addstr(dy, dx, ' ', self._curses.color_pair(pair))
+            except:
+                # Swallow errors for now
+                pass
+
+
     def show(self):
         self._display.refresh()
 
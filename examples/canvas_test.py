@@ -4,27 +4,24 @@ Bounce some pixels around the canvas to make sure it works.
 """
 
 from   anydisplay               import Canvas
-from   anydisplay.pils          import MiniPiTFT13
-from   anydisplay.pimoroni      import UnicornHatHD
-from   anydisplay.rgbledmatrix  import RGBLEDMatrix
-from   anydisplay.sdl           import SDL
-from   anydisplay.terminal      import Curses
 
+import contextlib
 import time
-import math
 import numpy
-import random
 
 # Rock until you drop
-try:
-    # Bounce something around
-    #display = Curses()
-    #display = MiniPiTFT13()
-    #display = RGBLEDMatrix(rows=64, columns=64, gpio_slowdown=2)
-    display = SDL()
-    #display = UnicornHatHD()
+with contextlib.ExitStack() as stack:
+    # Bounce something around. We only import the display which we use.
+    #from anydisplay.terminal     import Curses;       display = Curses()
+    #from anydisplay.pils         import MiniPiTFT13;  display = MiniPiTFT13()
+    #from anydisplay.rgbledmatrix import RGBLEDMatrix; display = RGBLEDMatrix(rows=64, columns=64, gpio_slowdown=2)
+    from  anydisplay.sdl          import SDL;          display = SDL()
+    #from anydisplay.pimoroni     import UnicornHatHD; display = UnicornHatHD()
     canvas  = Canvas(display, xwrap=True, ywrap=True)
 
+    # Blank and shut down the display however we leave
+    stack.callback(canvas.quit)
+
     # Limits
     w = canvas.width  - 1
     h = canvas.height - 1
@@ -37,74 +34,50 @@ try:
     fps  = 100
     rate = 1 / fps
 
+    # Our source of randomness
+    rng = numpy.random.default_rng()
+
     # Point position and velocity
-    x  = numpy.zeros(c)
-    y  = numpy.zeros(c)
-    vx = numpy.zeros(c)
-    vy = numpy.zeros(c)
-    for i in range(c):
-        x [i] = random.randint(0, w)
-        y [i] = random.randint(0, h)
-        vx[i] = 0.3 + random.random() * 0.2
-        vy[i] = 0.4 + random.random() * 0.1
+    x  = rng.integers(0, w, size=c, endpoint=True).astype(float)
+    y  = rng.integers(0, h, size=c, endpoint=True).astype(float)
+    vx = 0.3 + rng.random(c) * 0.2
+    vy = 0.4 + rng.random(c) * 0.1
 
     # Colour position and velocity
-    r  = numpy.zeros(c)
-    g  = numpy.zeros(c)
-    b  = numpy.zeros(c)
-    vr = numpy.zeros(c)
-    vg = numpy.zeros(c)
-    vb = numpy.zeros(c)
-    for i in range(c):
-        r [i] = random.random()
-        g [i] = random.random()
-        b [i] = random.random()
-        vr[i] = (random.random() - 0.5) * 0.01
-        vg[i] = (random.random() - 0.5) * 0.01
-        vb[i] = (random.random() - 0.5) * 0.01
+    r  = rng.random(c)
+    g  = rng.random(c)
+    b  = rng.random(c)
+    vr = (rng.random(c) - 0.5) * 0.01
+    vg = (rng.random(c) - 0.5) * 0.01
+    vb = (rng.random(c) - 0.5) * 0.01
 
     # And set them going
-    last = 0
+    deadline = time.perf_counter()
     while True:
-        since = time.time() - last
-        while since < rate:
-            time.sleep(rate - since)
-            since = time.time() - last
-
         canvas.clear()
-        for i in range(c):
-            # Move the point
-            if x[i] < 0:
-                vx[i] =  random.random() * 0.25 + 0.25
-            if x[i] > w:
-                vx[i] = -random.random() * 0.25 - 0.25
-            if y[i] < 0:
-                vy[i] =  random.random() * 0.25 + 0.25
-            if y[i] > h:
-                vy[i] = -random.random() * 0.25 - 0.25
-            x[i] += vx[i]
-            y[i] += vy[i]
+        # Move the points, bouncing them off the edges
+        vx = numpy.where(x < 0,  rng.random(c) * 0.25 + 0.25, vx)
+        vx = numpy.where(x > w, -rng.random(c) * 0.25 - 0.25, vx)
+        vy = numpy.where(y < 0,  rng.random(c) * 0.25 + 0.25, vy)
+        vy = numpy.where(y > h, -rng.random(c) * 0.25 - 0.25, vy)
+        x += vx
+        y += vy
 
-            # Move the colour
-            r[i] += vr[i]
-            g[i] += vg[i]
-            b[i] += vb[i]
-            if r[i] < 0 or r[i] > 1.0:
-                vr[i] = -vr[i]
-            if g[i] < 0 or g[i] > 1.0:
-                vg[i] = -vg[i]
-            if b[i] < 0 or b[i] > 1.0:
-                vb[i] = -vb[i]
+        # Move the colours, bouncing them off the limits
+        r += vr
+        g += vg
+        b += vb
+        vr = numpy.where((r < 0) | (r > 1.0), -vr, vr)
+        vg = numpy.where((g < 0) | (g > 1.0), -vg, vg)
+        vb = numpy.where((b < 0) | (b > 1.0), -vb, vb)
 
-            # Display the (big) pixel
-            canvas.set(x[i], y[i], r[i], g[i], b[i], s)
+        # Display the (big) pixels
+        canvas.set_many(x, y, r, g, b, s)
         canvas.show()
-        last = time.time()
 
-except:
-    # Tidy and rethrow
-    display.quit()
-    canvas.clear()
-    canvas.show()
-    canvas.quit()
-    raise
+        # Wait for the next frame. We work from a fixed deadline so that any
+        # jitter in how long we sleep doesn't accumulate.
+        deadline += rate
+        delay = deadline - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
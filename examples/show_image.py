@@ -4,11 +4,9 @@ Display an image.
 """
 
 from   anydisplay               import Canvas, NullDisplay
-from   anydisplay.pimoroni      import UnicornHatHD
-from   anydisplay.rgbledmatrix  import RGBLEDMatrix
-from   anydisplay.terminal      import Curses
 from   PIL                      import Image
 
+import numpy
 import sys
 import time
 
@@ -17,19 +15,19 @@ if len(sys.argv) != 2:
     print("Usage: %s <image>" % sys.argv[0])
     sys.exit(1)
 
-# What we display on
-display = Curses()
+# What we display on. We only import the display which we use.
+from  anydisplay.terminal     import Curses;       display = Curses()
 #display = NullDisplay(64, 64)
-#display = RGBLEDMatrix()
-#display = UnicornHatHD()
+#from anydisplay.rgbledmatrix import RGBLEDMatrix; display = RGBLEDMatrix()
+#from anydisplay.pimoroni     import UnicornHatHD; display = UnicornHatHD()
 canvas  = Canvas(display, xwrap=False, ywrap=False)
 
 try:
     # Load in the image
     image = Image.open(sys.argv[1])
 
-    # Display the image
-    canvas.set_image(image)
+    # Display the image, stretched to fill the display
+    canvas.blit_rgb(numpy.asarray(image.convert('RGB')))
     canvas.show()
 
     # Wait for a bit
@@ -3,7 +3,7 @@
 Simple smoketests for the AnyDisplay code.
 """
 
-import math
+import numpy
 import pytest
 
 def test_null():
@@ -14,14 +14,173 @@ def test_null():
     canvas  = Canvas(display)
 
     # Drive the mechanics of it
-    for x in range(display.width):
-        for y in range(display.height):
-            r = x / display.width
-            g = y / display.height
-            b = (math.sqrt(            x ** 2 +              y ** 2) /
-                 math.sqrt(display.width ** 2 + display.height ** 2))
-            canvas.set(x, y, r, g, b, 2.0)
+    (w, h) = (display.width, display.height)
+    (xs, ys) = numpy.meshgrid(numpy.arange(w), numpy.arange(h), indexing='ij')
+    r = xs / w
+    g = ys / h
+    b = numpy.hypot(xs, ys) / numpy.hypot(w, h)
+    canvas.set_many(xs.ravel(), ys.ravel(), r.ravel(), g.ravel(), b.ravel(), 2.0)
+
+
+def test_wrap_far_off_canvas():
+    from anydisplay import Canvas, NullDisplay
+
+    # Drawing way off the canvas, when wrapping, should be the same as
+    # drawing at the equivalent place on it
+    far  = Canvas(NullDisplay(8, 8), xwrap=True, ywrap=True)
+    near = Canvas(NullDisplay(8, 8), xwrap=True, ywrap=True)
+    for i in range(20):
+        far .set( 30 + i,  40, 1.0, 0.0, 0.0, 2.0)
+        near.set((30 + i) % 8,  0, 1.0, 0.0, 0.0, 2.0)
+        far .set( 30.5 + i,  41.25, 0.0, 1.0, 0.0, 1.5)
+        near.set((30.5 + i) % 8, 1.25, 0.0, 1.0, 0.0, 1.5)
+    assert numpy.array_equal(far._planes, near._planes)
+    assert numpy.array_equal(far._dirty,  near._dirty)
+    assert far._r.sum() > 0
+
+
+def test_big_pixels_at_edges():
+    from anydisplay import Canvas, NullDisplay
+
+    # Pixels bigger than the canvas, near and beyond its edges. When wrapping
+    # they cover the whole canvas, however far off they are.
+    for (x, y) in ((7.5, 0.25), (87.5, 160.25), (-0.5, 7.75)):
+        canvas = Canvas(NullDisplay(8, 8), xwrap=True, ywrap=True)
+        canvas.set(x, y, 1.0, 0.5, 0.0, 20.0)
+        assert numpy.all(canvas._f == 1.0)
+        assert numpy.all(canvas._r == 1.0)
+        assert numpy.all(canvas._dirty)
+
+    # And, when not wrapping, only the parts on the canvas get drawn
+    canvas = Canvas(NullDisplay(8, 8))
+    canvas.set(10.0, 4.0, 1.0, 0.5, 0.0, 10.0)
+    assert numpy.all(canvas._f[:4] == 0.0)
+    assert numpy.all(canvas._f[5:] == 1.0)
+    canvas.set(-100.0, -100.0, 1.0, 0.5, 0.0, 20.0)
+    assert numpy.all(canvas._f[:4] == 0.0)
+
+
+def test_nan_colour():
+    from anydisplay import Canvas, NullDisplay
+
+    # NaN colours are treated as zero, for whole pixels and for blended ones
+    nan = float('nan')
+    for s in (1.0, 0.5, 2.0):
+        canvas = Canvas(NullDisplay(8, 8))
+        canvas.set(4, 4, nan, 1.0, nan, s)
+        assert not numpy.isnan(canvas._planes).any()
+        assert canvas._r.max() == 0.0
+        assert canvas._g.max() >  0.0
+
+
+def test_set_image():
+    from anydisplay import Canvas, Display, NullDisplay
+    from PIL        import Image
+
+    class Recorder(NullDisplay):
+        """
+        A display which remembers what was last sent to each pixel.
+        """
+        def clear(self):
+            self.pixels = {}
+
+        def set(self, x, y, r, g, b):
+            self.pixels[(int(x), int(y))] = \
+                tuple(int(round(255 * float(v))) for v in (r, g, b))
+
+        def set_many(self, xs, ys, rs, gs, bs):
+            Display.set_many(self, xs, ys, rs, gs, bs)
+
+    def check(iw, ih, xwrap, expected):
+        """
+        Show an image whose pixels encode their coordinates and check that
+        the display pixels got the ones which we expected. ``expected`` maps
+        display coordinates to image ones, or to ``None`` for unpainted ones.
+        """
+        display = Recorder(8, 8)
+        canvas  = Canvas(display, xwrap=xwrap)
+        canvas.clear()
+        (iy, ix) = numpy.mgrid[0:ih, 0:iw]
+        rgb = numpy.stack((ix * 16, iy * 16, numpy.full_like(ix, 255)),
+                          axis=-1).astype(numpy.uint8)
+        canvas.set_image(Image.fromarray(rgb, 'RGB'))
+        canvas.show()
+
+        for x in range(8):
+            for y in range(8):
+                want = expected(x, y)
+                if want is None:
+                    assert (x, y) not in display.pixels
+                else:
+                    assert display.pixels[(x, y)] == tuple(rgb[want[1], want[0]])
+
+    # The same size as the display, so it's copied straight in
+    check(8, 8, False, lambda x, y: (x, y))
+
+    # Wider than the display, so the columns get squashed together with the
+    # last one winning. The final image column falls off the right hand edge,
+    # unless we wrap, in which case it lands on the first display column.
+    columns = (1, 2, 5, 6, 9, 10, 13, 14)
+    check(16, 8, False, lambda x, y: (columns[x], y))
+    check(16, 8, True,  lambda x, y: (15 if x == 0 else columns[x], y))
+
+    # Smaller than the display, so each image pixel gets drawn as a bigger
+    # one. These are centered on the scaled coordinates so the first column
+    # and row get mostly overdrawn and the last ones don't reach the edges.
+    check(4, 4, False,
+          lambda x, y: ((x // 2 + 1, y // 2 + 1) if x < 6 and y < 6 else None))
+
+
+def test_blit_rgb():
+    from anydisplay import Canvas, NullDisplay
+
+    # Create a display which goes nowhere
+    display = NullDisplay(64, 32)
+    canvas  = Canvas(display)
+
+    # Arrays which are the same size as the display, and a different one
+    for (h, w) in ((32, 64), (100, 50)):
+        rgb = numpy.zeros((h, w, 3), dtype=numpy.uint8)
+        rgb[:,:,0] = 255
+        canvas.blit_rgb(rgb)
+        assert numpy.all(canvas._r == 1.0)
+        assert numpy.all(canvas._g == 0.0)
+        canvas.show()
+
+    # It has to be RGB values
+    with pytest.raises(ValueError):
+        canvas.blit_rgb(numpy.zeros((32, 64), dtype=numpy.uint8))
+
+
+def test_sdl_set_u8(monkeypatch):
+    pytest.importorskip('sdl2')
+    from anydisplay.sdl import SDL
+
+    # Render off-screen
+    monkeypatch.setenv('SDL_VIDEODRIVER',   'dummy')
+    monkeypatch.setenv('SDL_RENDER_DRIVER', 'software')
+    display = SDL(width=8, height=4)
+    try:
+        # Byte values, as they come out of a numpy array, should be the same
+        # as the equivalent float ones
+        rgb = numpy.array((255, 128, 51), dtype=numpy.uint8)
+        display.set_u8(3, 2, *rgb)
+        assert tuple(display._fb[2, 3]) == (255, 128, 51, 255)
+        display.set(1, 1, 1.0, 128 / 255, 0.2)
+        assert tuple(display._fb[1, 1]) == (255, 128, 51, 255)
+        display.show()
+    finally:
+        display.quit()
+
+    # Shutting down twice, or showing afterwards, is harmless
+    display.quit()
+    display.show()
 
 
 if __name__ == "__main__":
     test_null()
+    test_wrap_far_off_canvas()
+    test_big_pixels_at_edges()
+    test_nan_colour()
+    test_set_image()
+    test_blit_rgb()